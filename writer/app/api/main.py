@@ -1,10 +1,47 @@
-from fastapi import APIRouter, Request
+from contextlib import suppress
+from pathlib import Path
+
+import aiofiles
+import aiofiles.os
+from fastapi import APIRouter, HTTPException, Request
+
+from app.core.config import settings
 
 
 api_router = APIRouter(prefix="/upload", tags=["writer"])
 
 
+def _is_valid_file_name(file_name: str) -> bool:
+    return (
+        file_name not in ("", "..")
+        and "\0" not in file_name
+        and Path(file_name).name == file_name
+    )
+
+
 @api_router.post("/")
-async def upload(*, request: Request):
-    ...
+async def upload(*, request: Request, file_name: str):
+    """
+    Stream the request body to storage without holding it in memory.
+    Incoming chunks are coalesced into CHUNK_SIZE writes.
+    """
+    if not _is_valid_file_name(file_name):
+        raise HTTPException(status_code=400, detail="Invalid file name.")
+
+    await aiofiles.os.makedirs(settings.STORAGE_DATA_PATH, exist_ok=True)
+    file_path = settings.STORAGE_DATA_PATH / file_name
+    buffer = bytearray()
+    try:
+        async with aiofiles.open(file_path, "wb") as f:
+            async for chunk in request.stream():
+                buffer += chunk
+                if len(buffer) >= settings.CHUNK_SIZE:
+                    await f.write(buffer)
+                    buffer.clear()
+            if buffer:
+                await f.write(buffer)
+    except Exception:
+        with suppress(FileNotFoundError):
+            await aiofiles.os.remove(file_path)
+        raise
     return {"message": "OK"}
@@ -1,6 +1,6 @@
-import sentry_sdk
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.routing import APIRoute
 
 from app.core.config import settings
@@ -16,7 +16,12 @@ def custom_generate_unique_id(route: APIRoute) -> str:
 
 
 if settings.SENTRY_DSN and settings.ENVIRONMENT != "local":
-    sentry_sdk.init(dsn=str(settings.SENTRY_DSN), enable_tracing=True)
+    import sentry_sdk
+
+    sentry_sdk.init(
+        dsn=str(settings.SENTRY_DSN),
+        traces_sample_rate=settings.SENTRY_TRACES_SAMPLE_RATE,
+    )
 
 
 def create_app() -> FastAPI:
@@ -24,14 +29,15 @@ def create_app() -> FastAPI:
         title=settings.PROJECT_NAME,
         openapi_url=f"{settings.API_V1_STR}/openapi.json",
         generate_unique_id_function=custom_generate_unique_id,
+        default_response_class=ORJSONResponse,
     )
     if settings.all_cors_origins:
         app.add_middleware(
             CORSMiddleware,
             allow_origins=settings.all_cors_origins,
             allow_credentials=True,
-            allow_methods=["*"],
-            allow_headers=["*"],
+            allow_methods=["GET", "POST"],
+            allow_headers=["Authorization", "Content-Type"],
         )
     app.include_router(api_router, prefix=settings.API_V1_STR)
     return app
@@ -1,7 +1,9 @@
+from dataclasses import dataclass
 from typing import Literal
 from uuid import UUID
 
 
+@dataclass(slots=True, kw_only=True)
 class File:
     id: int
     name: str
@@ -11,9 +13,10 @@ class File:
     is_ready: bool
 
 
+@dataclass(slots=True, kw_only=True)
 class ChunkPerFile:
     id: int
     user_id: UUID
     file_id: int
-    chunk_hash: str
+    chunk_hash: bytes
     index: int